@@ -0,0 +1,204 @@
+from __future__ import annotations
+from array import array
+from heapq import heappush, heappushpop
+from math import asin, cos, radians, sin, sqrt
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from customexceptions import InvalidArgument
+from geodesy import EARTH_RADIUS, to_float_position
+
+
+# (latitude in radians, longitude in radians, cosine of latitude)
+_Prepared = Tuple[float, float, float]
+
+# Every distance is stored as a C double
+_ITEM_SIZE = array('d').itemsize
+
+
+def _prepare(positions: Iterable) -> List[_Prepared]:
+    prepared = []
+    for position in positions:
+        latitude, longitude = to_float_position(position)
+        phi = radians(latitude)
+        prepared.append((phi, radians(longitude), cos(phi)))
+    return prepared
+
+
+def _compute_block(origins: Sequence[_Prepared], destinations: Sequence[_Prepared],
+                   radius: float) -> List[array]:
+    # Module level so that it can be pickled for the process pool
+    rows = []
+    for phi1, lambda1, cos1 in origins:
+        row = array('d')
+        for phi2, lambda2, cos2 in destinations:
+            a = sin((phi2 - phi1) / 2) ** 2 + \
+                cos1 * cos2 * sin((lambda2 - lambda1) / 2) ** 2
+            row.append(2 * radius * asin(min(1.0, sqrt(a))))
+        rows.append(row)
+    return rows
+
+
+def _compute_block_star(arguments) -> List[array]:
+    return _compute_block(*arguments)
+
+
+class Tile:
+    """A rectangular block of the distance matrix."""
+
+    def __init__(self, row_start: int, column_start: int, values: List[array]):
+        """Initializes an instance of Tile
+
+        Args:
+            row_start (int): Index of the first origin in the tile.
+            column_start (int): Index of the first destination in the tile.
+            values (List[array]): One array of distances per origin.
+        """
+        self.row_start = row_start
+        self.column_start = column_start
+        self.values = values
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.values), len(self.values[0]) if self.values else 0
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(row_start={self.row_start}, "
+                f"column_start={self.column_start}, shape={self.shape})")
+
+
+class DistanceMatrix:
+    """Great-circle distance matrix computed block by block under a memory budget.
+
+    The full N x M matrix is never materialized. Tiles are yielded one at a time,
+    or reduced on the fly to the k nearest destinations or to the pairs within a
+    threshold. If destinations is omitted, origins are compared against
+    themselves and the diagonal is left out of the reductions.
+    """
+
+    def __init__(self, origins: Iterable, destinations: Optional[Iterable] = None,
+                 memory_limit: int = 64 * 2**20, processes: Optional[int] = None,
+                 radius: float = EARTH_RADIUS):
+        """Initializes an instance of DistanceMatrix
+
+        Args:
+            origins (Iterable): (Latitude, Longitude) pairs, the matrix rows.
+            destinations (Iterable, optional): (Latitude, Longitude) pairs, the matrix
+                                               columns. Defaults to origins.
+            memory_limit (int, optional): Bytes allowed for a single tile.
+                                          Defaults to 64 MiB.
+            processes (int, optional): Spread tiles across a process pool of this size.
+                                       Up to this many tiles are held at once.
+                                       Defaults to None, computing in-process.
+            radius (float, optional): Sphere radius. Defaults to EARTH_RADIUS (meters).
+
+        Raises:
+            InvalidArgument: If memory_limit cannot hold one distance, or processes is
+                             less than 1.
+        """
+        if memory_limit < _ITEM_SIZE:
+            raise InvalidArgument(
+                f"Memory limit must be at least {_ITEM_SIZE} bytes.")
+        if processes is not None and processes < 1:
+            raise InvalidArgument("Number of processes must be at least 1.")
+        self._origins = _prepare(origins)
+        self._symmetric = destinations is None
+        self._destinations = self._origins if self._symmetric else _prepare(destinations)
+        self._memory_limit = memory_limit
+        self._processes = processes
+        self._radius = radius
+
+    #---------------------------------------------#
+    #--------------CLASS PROPERTIES---------------#
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self._origins), len(self._destinations)
+
+    @property
+    def block_shape(self) -> Tuple[int, int]:
+        """Largest tile shape that fits in memory_limit."""
+        cells = self._memory_limit // _ITEM_SIZE
+        columns = max(1, min(len(self._destinations), cells))
+        rows = max(1, min(len(self._origins), cells // columns))
+        return rows, columns
+
+    #---------------------------------------------#
+    #-------------------TILES---------------------#
+
+    def tiles(self) -> Iterator[Tile]:
+        """Computes the matrix tile by tile, in row-major order.
+
+        Yields:
+            Tile: Block of distances, in the unit of radius.
+        """
+        blocks = self.__blocks()
+        if self._processes is None:
+            for row_start, column_start, arguments in blocks:
+                yield Tile(row_start, column_start, _compute_block(*arguments))
+            return
+        with Pool(self._processes) as pool:
+            while True:
+                # Submit one tile per process at a time to keep memory bounded
+                batch = [block for _, block in zip(range(self._processes), blocks)]
+                if not batch:
+                    return
+                results = pool.map(_compute_block_star,
+                                   [arguments for _, _, arguments in batch])
+                for (row_start, column_start, _), values in zip(batch, results):
+                    yield Tile(row_start, column_start, values)
+
+    def __blocks(self):
+        rows, columns = self.block_shape
+        for row_start in range(0, len(self._origins), rows):
+            origins = self._origins[row_start:row_start + rows]
+            for column_start in range(0, len(self._destinations), columns):
+                destinations = self._destinations[column_start:column_start + columns]
+                yield row_start, column_start, (origins, destinations, self._radius)
+
+    #---------------------------------------------#
+    #-----------------REDUCTIONS------------------#
+
+    def nearest(self, k: int = 1) -> List[List[Tuple[float, int]]]:
+        """Finds the k nearest destinations of every origin.
+
+        Args:
+            k (int, optional): Number of neighbours to keep. Defaults to 1.
+
+        Raises:
+            InvalidArgument: If k is less than 1.
+
+        Returns:
+            List[List[Tuple[float, int]]]: Per origin, (distance, destination index)
+                                           pairs sorted by distance.
+        """
+        if k < 1:
+            raise InvalidArgument("k must be at least 1.")
+        # Max-heaps of negated distances, so the farthest kept neighbour is on top
+        heaps: List[list] = [[] for _ in self._origins]
+        for tile in self.tiles():
+            for row_offset, row in enumerate(tile.values):
+                i = tile.row_start + row_offset
+                heap = heaps[i]
+                for j, distance in enumerate(row, tile.column_start):
+                    if self._symmetric and i == j:
+                        continue
+                    if len(heap) < k:
+                        heappush(heap, (-distance, j))
+                    elif -distance > heap[0][0]:
+                        heappushpop(heap, (-distance, j))
+        return [sorted((-distance, j) for distance, j in heap) for heap in heaps]
+
+    def within(self, threshold: float) -> Iterator[Tuple[int, int, float]]:
+        """Finds every pair closer than or equal to threshold, as a sparse matrix.
+
+        Args:
+            threshold (float): Maximum distance, in the unit of radius.
+
+        Yields:
+            Tuple[int, int, float]: (origin index, destination index, distance).
+        """
+        for tile in self.tiles():
+            for i, row in enumerate(tile.values, tile.row_start):
+                for j, distance in enumerate(row, tile.column_start):
+                    if distance <= threshold and not (self._symmetric and i == j):
+                        yield i, j, distance
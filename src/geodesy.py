@@ -0,0 +1,91 @@
+from __future__ import annotations
+from math import acos, asin, atan2, cos, radians, sin, sqrt
+from typing import Tuple
+
+
+# Mean Earth radius in meters (IUGG), used for all spherical computations.
+EARTH_RADIUS = 6371008.8
+
+FloatPosition = Tuple[float, float]
+
+
+def to_float_position(position) -> FloatPosition:
+    """Converts a (Latitude, Longitude) pair into decimal degrees.
+
+    Args:
+        position (tuple): Pair of Latitude and Longitude, or anything
+                          that can be converted with float().
+
+    Returns:
+        FloatPosition: (latitude, longitude) in decimal degrees.
+    """
+    latitude, longitude = position
+    return float(latitude), float(longitude)
+
+
+def central_angle(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Angular distance in radians between two points given in decimal degrees.
+
+    Uses the haversine formula, which stays well conditioned for short distances.
+    """
+    phi1, phi2 = radians(lat1), radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = radians(lon2 - lon1)
+    a = sin(dphi / 2) ** 2 + cos(phi1) * cos(phi2) * sin(dlambda / 2) ** 2
+    return 2 * asin(min(1.0, sqrt(a)))
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float,
+              radius: float = EARTH_RADIUS) -> float:
+    """Great-circle distance between two points given in decimal degrees.
+
+    Args:
+        lat1, lon1 (float): First point.
+        lat2, lon2 (float): Second point.
+        radius (float, optional): Sphere radius. Defaults to EARTH_RADIUS (meters).
+
+    Returns:
+        float: Distance in the same unit as radius.
+    """
+    return central_angle(lat1, lon1, lat2, lon2) * radius
+
+
+def initial_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial bearing in radians from the first point towards the second."""
+    phi1, phi2 = radians(lat1), radians(lat2)
+    dlambda = radians(lon2 - lon1)
+    y = sin(dlambda) * cos(phi2)
+    x = cos(phi1) * sin(phi2) - sin(phi1) * cos(phi2) * cos(dlambda)
+    return atan2(y, x)
+
+
+def segment_distance(point: FloatPosition, start: FloatPosition, end: FloatPosition,
+                     radius: float = EARTH_RADIUS) -> float:
+    """Shortest distance from a point to the great-circle arc between start and end.
+
+    If the foot of the perpendicular falls outside of the arc, the distance
+    to the nearest endpoint is returned instead.
+
+    Args:
+        point (FloatPosition): (latitude, longitude) in decimal degrees.
+        start (FloatPosition): Start of the arc.
+        end (FloatPosition): End of the arc.
+        radius (float, optional): Sphere radius. Defaults to EARTH_RADIUS (meters).
+
+    Returns:
+        float: Distance in the same unit as radius.
+    """
+    d13 = central_angle(*start, *point)
+    d12 = central_angle(*start, *end)
+    if d12 == 0.0 or d13 == 0.0:
+        return d13 * radius
+    dtheta = initial_bearing(*start, *point) - initial_bearing(*start, *end)
+    # Point lies "behind" the start of the arc
+    if cos(dtheta) < 0:
+        return d13 * radius
+    cross_track = asin(max(-1.0, min(1.0, sin(d13) * sin(dtheta))))
+    along_track = acos(max(-1.0, min(1.0, cos(d13) / cos(cross_track))))
+    if along_track > d12:
+        return central_angle(*end, *point) * radius
+    return abs(cross_track) * radius
+
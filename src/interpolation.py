@@ -0,0 +1,186 @@
+from __future__ import annotations
+from array import array
+from math import atan2, cos, degrees, hypot, radians, sin, sqrt
+from typing import Iterable, Sequence, Tuple
+from customexceptions import InvalidArgument
+from geodesy import EARTH_RADIUS, to_float_position
+from latitudecoordinates import Latitude
+from longitudecoordinates import Longitude
+
+
+# Below this angle (radians) slerp falls back to normalized linear interpolation
+_SMALL_ANGLE = 1e-12
+
+# Columns of unit vector components, one entry per position
+_Vectors = Tuple[array, array, array]
+
+
+#---------------------------------------------#
+#--------------COLUMN CONVERSION--------------#
+
+def _to_vectors(positions: Iterable) -> _Vectors:
+    xs, ys, zs = array('d'), array('d'), array('d')
+    for position in positions:
+        latitude, longitude = to_float_position(position)
+        phi, lam = radians(latitude), radians(longitude)
+        xs.append(cos(phi) * cos(lam))
+        ys.append(cos(phi) * sin(lam))
+        zs.append(sin(phi))
+    return xs, ys, zs
+
+
+def _angles(vectors: _Vectors) -> array:
+    # Angle of every segment, atan2 stays accurate for tiny and near-antipodal angles
+    xs, ys, zs = vectors
+    angles = array('d')
+    for i in range(len(xs) - 1):
+        x1, y1, z1, x2, y2, z2 = xs[i], ys[i], zs[i], xs[i + 1], ys[i + 1], zs[i + 1]
+        cross = sqrt((y1 * z2 - z1 * y2) ** 2 + (z1 * x2 - x1 * z2) ** 2 + (x1 * y2 - y1 * x2) ** 2)
+        angles.append(atan2(cross, x1 * x2 + y1 * y2 + z1 * z2))
+    return angles
+
+
+def _from_columns(latitudes: Sequence[float], longitudes: Sequence[float], cast: bool) -> list:
+    if not cast:
+        return list(zip(latitudes, longitudes))
+    return [(Latitude.cast(latitude), Longitude.cast(longitude))
+            for latitude, longitude in zip(latitudes, longitudes)]
+
+
+#---------------------------------------------#
+#----------------INTERPOLATION----------------#
+
+def _interpolate(vectors: _Vectors, angles: array, stations: Sequence[float],
+                 targets: Iterable[float]) -> Tuple[array, array]:
+    """Slerps at every target along a track in one pass.
+
+    Args:
+        vectors (_Vectors): Unit vectors of the track positions.
+        angles (array): Angle of every segment.
+        stations (Sequence[float]): Non-decreasing parameter (distance or time)
+                                    at every position.
+        targets (Iterable[float]): Non-decreasing parameters to interpolate at.
+
+    Returns:
+        tuple: Latitude and longitude columns in decimal degrees.
+    """
+    xs, ys, zs = vectors
+    latitudes, longitudes = array('d'), array('d')
+    last = len(stations) - 1
+    i = 0
+    for target in targets:
+        while i < last - 1 and stations[i + 1] < target:
+            i += 1
+        if last == 0:
+            x, y, z = xs[0], ys[0], zs[0]
+        else:
+            span = stations[i + 1] - stations[i]
+            fraction = 0.0 if span == 0 else min(1.0, max(0.0, (target - stations[i]) / span))
+            omega = angles[i]
+            if omega < _SMALL_ANGLE:
+                a, b = 1 - fraction, fraction
+            else:
+                a = sin((1 - fraction) * omega) / sin(omega)
+                b = sin(fraction * omega) / sin(omega)
+            x = a * xs[i] + b * xs[i + 1]
+            y = a * ys[i] + b * ys[i + 1]
+            z = a * zs[i] + b * zs[i + 1]
+        latitudes.append(degrees(atan2(z, hypot(x, y))))
+        longitudes.append(degrees(atan2(y, x)))
+    return latitudes, longitudes
+
+
+def slerp(start, end, fractions: Iterable[float], cast: bool = True) -> list:
+    """Interpolates along the great circle between two positions.
+
+    Unlike interpolating the decimal degrees, this follows the shortest path,
+    including across the antimeridian and over the poles.
+
+    Args:
+        start (tuple): (Latitude, Longitude) pair at fraction 0.
+        end (tuple): (Latitude, Longitude) pair at fraction 1.
+        fractions (Iterable[float]): Non-decreasing fractions from 0 to 1.
+        cast (bool, optional): Return (Latitude, Longitude) pairs if True, or
+                               decimal degrees if False. Defaults to True.
+
+    Returns:
+        list: One position per fraction.
+    """
+    vectors = _to_vectors((start, end))
+    latitudes, longitudes = _interpolate(vectors, _angles(vectors), (0.0, 1.0), fractions)
+    return _from_columns(latitudes, longitudes, cast)
+
+
+#---------------------------------------------#
+#-----------------RESAMPLING------------------#
+
+def _validate_interval(interval: float) -> None:
+    if interval <= 0:
+        raise InvalidArgument("Interval must be greater than zero.")
+
+
+def _steps(first: float, last: float, interval: float) -> Iterable[float]:
+    count = int((last - first) // interval) + 1
+    return (first + n * interval for n in range(count))
+
+
+def resample_by_distance(positions: Iterable, interval: float, cast: bool = True,
+                         radius: float = EARTH_RADIUS) -> list:
+    """Resamples a track to positions evenly spaced along its great-circle path.
+
+    Args:
+        positions (Iterable): (Latitude, Longitude) pairs in track order.
+        interval (float): Distance between resampled positions, in the unit of radius.
+        cast (bool, optional): Return (Latitude, Longitude) pairs if True, or
+                               decimal degrees if False. Defaults to True.
+        radius (float, optional): Sphere radius. Defaults to EARTH_RADIUS (meters).
+
+    Raises:
+        InvalidArgument: If interval is not greater than zero.
+
+    Returns:
+        list: Positions at distance 0, interval, 2 * interval, ... up to the track length.
+    """
+    _validate_interval(interval)
+    vectors = _to_vectors(positions)
+    if not vectors[0]:
+        return []
+    angles = _angles(vectors)
+    stations = array('d', [0.0])
+    for omega in angles:
+        stations.append(stations[-1] + omega * radius)
+    targets = _steps(0.0, stations[-1], interval)
+    latitudes, longitudes = _interpolate(vectors, angles, stations, targets)
+    return _from_columns(latitudes, longitudes, cast)
+
+
+def resample_by_time(positions: Iterable, timestamps: Iterable[float], interval: float,
+                     cast: bool = True) -> list:
+    """Resamples a track to positions at a fixed time interval.
+
+    Args:
+        positions (Iterable): (Latitude, Longitude) pairs in track order.
+        timestamps (Iterable[float]): Non-decreasing time of every position.
+        interval (float): Time between resampled positions, in the unit of timestamps.
+        cast (bool, optional): Return (Latitude, Longitude) pairs if True, or
+                               decimal degrees if False. Defaults to True.
+
+    Raises:
+        InvalidArgument: If interval is not greater than zero, or timestamps do not
+                         match positions or are not in order.
+
+    Returns:
+        list: Positions at the first timestamp, then every interval up to the last one.
+    """
+    _validate_interval(interval)
+    vectors = _to_vectors(positions)
+    stations = array('d', timestamps)
+    if len(stations) != len(vectors[0]):
+        raise InvalidArgument("There must be exactly one timestamp per position.")
+    if any(stations[i + 1] < stations[i] for i in range(len(stations) - 1)):
+        raise InvalidArgument("Timestamps must be in non-decreasing order.")
+    if not stations:
+        return []
+    targets = _steps(stations[0], stations[-1], interval)
+    latitudes, longitudes = _interpolate(vectors, _angles(vectors), stations, targets)
+    return _from_columns(latitudes, longitudes, cast)
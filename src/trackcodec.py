@@ -0,0 +1,202 @@
+from __future__ import annotations
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+from customexceptions import InvalidArgument
+from geodesy import to_float_position
+from latitudecoordinates import Latitude
+from longitudecoordinates import Longitude
+
+
+# Number of decimal places kept by default, about 11 cm at the equator.
+DEFAULT_PRECISION = 6
+MAX_PRECISION = 10
+DEFAULT_CHUNK_SIZE = 4096
+
+# Layout of an encoded chunk, every integer is a LEB128 varint:
+#
+#     count | precision | count zigzag deltas of latitude | count zigzag deltas of longitude
+#
+# Coordinates are quantized to integers of 10**-precision degrees, so the precision
+# loss is bounded by half of that. Each chunk starts its deltas from zero and can be
+# decoded on its own. A stream is a sequence of chunks, each prefixed by its byte length.
+
+
+#---------------------------------------------#
+#-------------INTEGER PACKING-----------------#
+
+def zigzag(value: int) -> int:
+    """Maps signed integers to unsigned so that small magnitudes stay small."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise InvalidArgument("Encoded track is truncated.")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def _validate_precision(precision: int) -> None:
+    if not isinstance(precision, int) or not 0 <= precision <= MAX_PRECISION:
+        raise InvalidArgument(
+            f"Precision must be an integer from 0 to {MAX_PRECISION}.")
+
+
+#---------------------------------------------#
+#----------------SINGLE CHUNK-----------------#
+
+def encode(positions: Iterable, precision: int = DEFAULT_PRECISION) -> bytes:
+    """Encodes positions into a single chunk.
+
+    Args:
+        positions (Iterable): (Latitude, Longitude) pairs.
+        precision (int, optional): Decimal places of degrees to keep.
+                                   Defaults to DEFAULT_PRECISION.
+
+    Raises:
+        InvalidArgument: If precision is out of range.
+
+    Returns:
+        bytes: Encoded chunk.
+    """
+    _validate_precision(precision)
+    scale = 10 ** precision
+    latitudes, longitudes = [], []
+    for position in positions:
+        latitude, longitude = to_float_position(position)
+        latitudes.append(round(latitude * scale))
+        longitudes.append(round(longitude * scale))
+    buffer = bytearray()
+    _write_varint(buffer, len(latitudes))
+    _write_varint(buffer, precision)
+    # Columnar layout keeps similar deltas next to each other
+    for column in (latitudes, longitudes):
+        previous = 0
+        for value in column:
+            _write_varint(buffer, zigzag(value - previous))
+            previous = value
+    return bytes(buffer)
+
+
+def decode(data: bytes, cast: bool = True) -> List[tuple]:
+    """Decodes a single chunk produced by encode().
+
+    Args:
+        data (bytes): Encoded chunk.
+        cast (bool, optional): Return (Latitude, Longitude) pairs if True, or
+                               decimal degrees if False. Defaults to True.
+
+    Raises:
+        InvalidArgument: If data is truncated or malformed.
+
+    Returns:
+        List[tuple]: Decoded positions.
+    """
+    count, offset = _read_varint(data, 0)
+    precision, offset = _read_varint(data, offset)
+    _validate_precision(precision)
+    scale = 10 ** precision
+    columns = []
+    for _ in range(2):
+        column, value = [], 0
+        for _ in range(count):
+            delta, offset = _read_varint(data, offset)
+            value += unzigzag(delta)
+            column.append(round(value / scale, precision))
+        columns.append(column)
+    if offset != len(data):
+        raise InvalidArgument("Encoded track has trailing data.")
+    if not cast:
+        return list(zip(*columns))
+    return [(Latitude.cast(latitude), Longitude.cast(longitude))
+            for latitude, longitude in zip(*columns)]
+
+
+#---------------------------------------------#
+#-----------------STREAMING-------------------#
+
+def encode_stream(positions: Iterable, precision: int = DEFAULT_PRECISION,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Lazily encodes positions into length-prefixed chunks.
+
+    Args:
+        positions (Iterable): (Latitude, Longitude) pairs.
+        precision (int, optional): Decimal places of degrees to keep.
+                                   Defaults to DEFAULT_PRECISION.
+        chunk_size (int, optional): Positions per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Raises:
+        InvalidArgument: If precision is out of range or chunk_size is less than 1.
+
+    Yields:
+        bytes: Length-prefixed chunk, ready to be written to a file.
+    """
+    _validate_precision(precision)
+    if chunk_size < 1:
+        raise InvalidArgument("Chunk size must be at least 1.")
+    return _encode_stream(positions, precision, chunk_size)
+
+
+def _encode_stream(positions, precision, chunk_size):
+    chunk = []
+    for position in positions:
+        chunk.append(position)
+        if len(chunk) == chunk_size:
+            yield _frame(encode(chunk, precision))
+            chunk = []
+    if chunk:
+        yield _frame(encode(chunk, precision))
+
+
+def _frame(data: bytes) -> bytes:
+    header = bytearray()
+    _write_varint(header, len(data))
+    return bytes(header) + data
+
+
+def decode_stream(stream: BinaryIO, cast: bool = True) -> Iterator[tuple]:
+    """Lazily decodes positions from a binary file written with encode_stream().
+
+    Args:
+        stream (BinaryIO): Readable binary file object.
+        cast (bool, optional): Yield (Latitude, Longitude) pairs if True, or
+                               decimal degrees if False. Defaults to True.
+
+    Raises:
+        InvalidArgument: If the stream is truncated or malformed.
+
+    Yields:
+        tuple: Decoded positions, one chunk in memory at a time.
+    """
+    while True:
+        length = shift = 0
+        while True:
+            byte = stream.read(1)
+            if not byte:
+                if shift:
+                    raise InvalidArgument("Encoded track is truncated.")
+                return
+            length |= (byte[0] & 0x7f) << shift
+            shift += 7
+            if not byte[0] & 0x80:
+                break
+        data = stream.read(length)
+        if len(data) != length:
+            raise InvalidArgument("Encoded track is truncated.")
+        yield from decode(data, cast)
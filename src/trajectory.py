@@ -0,0 +1,215 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List, Optional, Tuple
+from customexceptions import InvalidArgument
+from geodesy import segment_distance, to_float_position
+
+
+# A position is a (Latitude, Longitude) pair; any pair accepted by float() works.
+Position = Tuple[object, object]
+
+
+class SimplificationReport:
+    """Summary of a simplification run, used to tune tolerance against storage cost."""
+
+    def __init__(self, points_in: int = 0, points_out: int = 0, max_error: float = 0.0):
+        """Initializes an instance of SimplificationReport
+
+        Args:
+            points_in (int): Number of positions read.
+            points_out (int): Number of positions kept.
+            max_error (float): Largest distance in meters from a dropped position
+                               to the simplified track.
+        """
+        self.points_in = points_in
+        self.points_out = points_out
+        self.max_error = max_error
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of positions read to positions kept, 1.0 if nothing was read."""
+        if self.points_out == 0:
+            return 1.0
+        return self.points_in / self.points_out
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(points_in={self.points_in}, "
+                f"points_out={self.points_out}, max_error={self.max_error})")
+
+
+def _validate_tolerance(tolerance: float) -> None:
+    if tolerance < 0:
+        raise InvalidArgument("Tolerance must not be negative.")
+
+
+def douglas_peucker(positions: Iterable[Position],
+                    tolerance: float) -> Tuple[List[Position], SimplificationReport]:
+    """Simplifies a track with the Douglas-Peucker algorithm on geodesic distance.
+
+    The whole track is held in memory; use TrajectorySimplifier for tracks
+    that arrive incrementally.
+
+    Args:
+        positions (Iterable[Position]): (Latitude, Longitude) pairs.
+        tolerance (float): Maximum allowed distance in meters between a dropped
+                           position and the simplified track.
+
+    Raises:
+        InvalidArgument: If tolerance is negative.
+
+    Returns:
+        tuple: List of kept positions (original objects), and a SimplificationReport.
+    """
+    _validate_tolerance(tolerance)
+    positions = list(positions)
+    points = [to_float_position(position) for position in positions]
+    report = SimplificationReport(points_in=len(points))
+    if len(points) < 3:
+        report.points_out = len(points)
+        return positions, report
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    # Iterative rather than recursive, long tracks would exceed recursion limit
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        farthest, max_distance = first, 0.0
+        for index in range(first + 1, last):
+            distance = segment_distance(points[index], points[first], points[last])
+            if distance > max_distance:
+                farthest, max_distance = index, distance
+        if max_distance > tolerance:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+        elif max_distance > report.max_error:
+            report.max_error = max_distance
+    simplified = [position for position, kept in zip(positions, keep) if kept]
+    report.points_out = len(simplified)
+    return simplified, report
+
+
+class TrajectorySimplifier:
+    """Streaming track simplification over a bounded sliding window.
+
+    Positions are pushed one at a time and kept positions are returned as soon
+    as they are known, so a track can be compressed while it is being received.
+    Memory use is bounded by the window size.
+    """
+
+    def __init__(self, tolerance: float, window: int = 256):
+        """Initializes an instance of TrajectorySimplifier
+
+        Args:
+            tolerance (float): Maximum allowed distance in meters between a dropped
+                               position and the simplified track.
+            window (int, optional): Maximum number of positions buffered before a
+                                    position is forcibly kept. Defaults to 256.
+
+        Raises:
+            InvalidArgument: If tolerance is negative or window is less than 2.
+        """
+        _validate_tolerance(tolerance)
+        if window < 2:
+            raise InvalidArgument("Window must hold at least 2 positions.")
+        self._tolerance = tolerance
+        self._window = window
+        self._anchor: Optional[Tuple[float, float]] = None
+        self._buffer: List[Tuple[Position, Tuple[float, float]]] = []
+        # Error of the dropped positions if the last buffered position is kept
+        self._pending_error = 0.0
+        self._report = SimplificationReport()
+
+    #---------------------------------------------#
+    #--------------CLASS PROPERTIES---------------#
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def report(self) -> SimplificationReport:
+        """Statistics of everything pushed so far."""
+        return self._report
+
+    #---------------------------------------------#
+    #-----------------STREAMING-------------------#
+
+    def push(self, position: Position) -> List[Position]:
+        """Feeds a position to the simplifier.
+
+        Args:
+            position (Position): (Latitude, Longitude) pair.
+
+        Returns:
+            List[Position]: Positions that are now known to be kept, possibly empty.
+        """
+        point = to_float_position(position)
+        self._report.points_in += 1
+        if self._anchor is None:
+            self._anchor = point
+            self._report.points_out += 1
+            return [position]
+        if self._buffer and len(self._buffer) < self._window:
+            error = self.__max_deviation(point)
+            if error <= self._tolerance:
+                self._buffer.append((position, point))
+                self._pending_error = error
+                return []
+        elif not self._buffer:
+            self._buffer.append((position, point))
+            return []
+        # The new position cannot be reached from the anchor, keep the previous one
+        kept = self.__commit()
+        self._buffer.append((position, point))
+        return [kept]
+
+    def flush(self) -> List[Position]:
+        """Ends the current track, returning the last position if it is still buffered.
+
+        Returns:
+            List[Position]: Remaining kept positions, possibly empty.
+        """
+        if not self._buffer:
+            return []
+        return [self.__commit()]
+
+    def simplify(self, positions: Iterable[Position]) -> Iterator[Position]:
+        """Lazily simplifies positions, flushing once the iterable is exhausted.
+
+        Args:
+            positions (Iterable[Position]): (Latitude, Longitude) pairs.
+
+        Yields:
+            Position: Kept positions in track order.
+        """
+        for position in positions:
+            yield from self.push(position)
+        yield from self.flush()
+
+    def __max_deviation(self, end: Tuple[float, float]) -> float:
+        # Deviation of every buffered position from the arc anchor -> end
+        return max((segment_distance(point, self._anchor, end)
+                    for _, point in self._buffer), default=0.0)
+
+    def __commit(self) -> Position:
+        position, point = self._buffer[-1]
+        if self._pending_error > self._report.max_error:
+            self._report.max_error = self._pending_error
+        self._report.points_out += 1
+        self._anchor = point
+        self._buffer = []
+        self._pending_error = 0.0
+        return position
+
+
+def simplify_stream(positions: Iterable[Position], tolerance: float,
+                    window: int = 256) -> Iterator[Position]:
+    """Shortcut for TrajectorySimplifier(tolerance, window).simplify(positions).
+
+    Use the class directly when the SimplificationReport is needed.
+    """
+    return TrajectorySimplifier(tolerance, window).simplify(positions)
@@ -0,0 +1,52 @@
+import unittest  # NOQA
+from customexceptions import InvalidArgument  # NOQA
+from distancematrix import DistanceMatrix  # NOQA
+from geodesy import haversine  # NOQA
+from latitudecoordinates import Latitude  # NOQA
+from longitudecoordinates import Longitude  # NOQA
+
+
+class DistanceMatrixTest(unittest.TestCase):
+    def setUp(self):
+        self.points = [(Latitude.cast(i * 0.1), Longitude.cast(i * 0.2))
+                       for i in range(-5, 6)]
+        self.floats = [(float(lat), float(lon)) for lat, lon in self.points]
+
+    def assertMatchesHaversine(self, matrix):
+        seen = 0
+        for tile in matrix.tiles():
+            for i, row in enumerate(tile.values, tile.row_start):
+                for j, distance in enumerate(row, tile.column_start):
+                    self.assertAlmostEqual(
+                        distance, haversine(*self.floats[i], *self.floats[j]), places=6)
+                    seen += 1
+        self.assertEqual(seen, len(self.points) ** 2)
+
+    def test_tiles(self):
+        # 80 bytes hold 10 distances, so the 11 x 11 matrix is split up
+        matrix = DistanceMatrix(self.points, memory_limit=80)
+        self.assertEqual(matrix.shape, (11, 11))
+        self.assertEqual(matrix.block_shape, (1, 10))
+        self.assertMatchesHaversine(matrix)
+        self.assertMatchesHaversine(DistanceMatrix(self.points, memory_limit=80, processes=2))
+        self.assertRaises(InvalidArgument, DistanceMatrix, self.points, memory_limit=4)
+        self.assertRaises(InvalidArgument, DistanceMatrix, self.points, processes=0)
+
+    def test_reductions(self):
+        matrix = DistanceMatrix(self.points, memory_limit=160)
+        nearest = matrix.nearest(k=2)
+        # Points are evenly spaced, the ends have neighbours on one side only
+        self.assertEqual([j for _, j in nearest[0]], [1, 2])
+        self.assertEqual(sorted(j for _, j in nearest[5]), [4, 6])
+        spacing = nearest[0][0][0]
+        pairs = list(matrix.within(spacing * 1.01))
+        self.assertEqual(len(pairs), 20)
+        self.assertTrue(all(abs(i - j) == 1 for i, j, _ in pairs))
+        # With separate destinations, the origin itself is a valid match
+        matrix = DistanceMatrix(self.points[:1], self.points)
+        self.assertEqual(matrix.nearest()[0], [(0.0, 0)])
+        self.assertRaises(InvalidArgument, matrix.nearest, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
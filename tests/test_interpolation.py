@@ -0,0 +1,51 @@
+import unittest  # NOQA
+from customexceptions import InvalidArgument  # NOQA
+from geodesy import haversine  # NOQA
+from interpolation import resample_by_distance, resample_by_time, slerp  # NOQA
+from latitudecoordinates import Latitude  # NOQA
+from longitudecoordinates import Longitude  # NOQA
+
+
+class InterpolationTest(unittest.TestCase):
+    def test_slerp(self):
+        # Across the antimeridian the midpoint is at 180, not at the Greenwich meridian
+        start = (Latitude.cast(0), Longitude.cast(179))
+        end = (Latitude.cast(0), Longitude.cast(-179))
+        (lat, lon), = slerp(start, end, [0.5], cast=False)
+        self.assertAlmostEqual(lat, 0)
+        self.assertAlmostEqual(abs(lon), 180)
+        # Over the pole the path passes through 90 N
+        start = (Latitude.cast(80), Longitude.cast(0))
+        end = (Latitude.cast(80), Longitude.cast(180))
+        midpoint, = slerp(start, end, [0.5])
+        self.assertIsInstance(midpoint[0], Latitude)
+        self.assertEqual(midpoint[0], Latitude(90, 0, 0, 'N'))
+        # Endpoints are reproduced
+        points = slerp(start, end, [0, 1], cast=False)
+        self.assertAlmostEqual(points[0][0], 80)
+        self.assertAlmostEqual(points[1][1], 180)
+
+    def test_resample_by_distance(self):
+        track = [(Latitude.cast(0), Longitude.cast(0)), (Latitude.cast(0), Longitude.cast(0.01)),
+                 (Latitude.cast(0.01), Longitude.cast(0.01))]
+        points = resample_by_distance(track, 100, cast=False)
+        # Two legs of about 1112 m each
+        self.assertEqual(len(points), 23)
+        # Except for the pair cutting the corner, positions are 100 m apart
+        distances = [haversine(*previous, *current) for previous, current in zip(points, points[1:])]
+        self.assertEqual(sum(abs(distance - 100) > 0.001 for distance in distances), 1)
+        self.assertEqual(resample_by_distance([], 100), [])
+        self.assertRaises(InvalidArgument, resample_by_distance, track, 0)
+
+    def test_resample_by_time(self):
+        track = [(Latitude.cast(0), Longitude.cast(0)), (Latitude.cast(0), Longitude.cast(0.01)),
+                 (Latitude.cast(0), Longitude.cast(0.01)), (Latitude.cast(0), Longitude.cast(0.02))]
+        points = resample_by_time(track, [0, 10, 10, 30], 5, cast=False)
+        self.assertEqual([round(lon, 6) for _, lon in points],
+                         [0, 0.005, 0.01, 0.0125, 0.015, 0.0175, 0.02])
+        self.assertRaises(InvalidArgument, resample_by_time, track, [0, 10], 5)
+        self.assertRaises(InvalidArgument, resample_by_time, track, [0, 10, 5, 30], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest  # NOQA
+from io import BytesIO  # NOQA
+from customexceptions import InvalidArgument  # NOQA
+from latitudecoordinates import Latitude  # NOQA
+from longitudecoordinates import Longitude  # NOQA
+from trackcodec import decode, decode_stream, encode, encode_stream, unzigzag, zigzag  # NOQA
+
+
+class TrackCodecTest(unittest.TestCase):
+    def setUp(self):
+        # Fixes a few arc-seconds apart, crossing the equator and the antimeridian
+        self.track = []
+        for i in range(20):
+            longitude = 179.99 + i * 0.0011
+            longitude = longitude - 360 if longitude > 180 else longitude
+            self.track.append((Latitude.cast(-0.01 + i * 0.0007), Longitude.cast(longitude)))
+
+    def test_zigzag(self):
+        for value in (0, -1, 1, -64, 63, -2**40, 2**40):
+            self.assertEqual(unzigzag(zigzag(value)), value)
+        self.assertEqual([zigzag(v) for v in (0, -1, 1, -2, 2)], [0, 1, 2, 3, 4])
+
+    def test_roundtrip(self):
+        data = encode(self.track, precision=6)
+        # Far smaller than the __repr__ text of the same track
+        self.assertLess(len(data) * 10, len(repr(self.track)))
+        decoded = decode(data)
+        self.assertIsInstance(decoded[0][0], Latitude)
+        self.assertIsInstance(decoded[0][1], Longitude)
+        for (lat, lon), (dlat, dlon) in zip(self.track, decode(data, cast=False)):
+            self.assertLessEqual(abs(float(lat) - dlat), 0.5e-6 + 1e-12)
+            self.assertLessEqual(abs(float(lon) - dlon), 0.5e-6 + 1e-12)
+        self.assertEqual(decode(encode([])), [])
+        self.assertRaises(InvalidArgument, encode, self.track, 11)
+        self.assertRaises(InvalidArgument, decode, data[:-1])
+        self.assertRaises(InvalidArgument, decode, data + b'\x00')
+
+    def test_stream(self):
+        stream = BytesIO(b''.join(encode_stream(iter(self.track), precision=5, chunk_size=7)))
+        decoded = list(decode_stream(stream, cast=False))
+        self.assertEqual(len(decoded), len(self.track))
+        for (lat, lon), (dlat, dlon) in zip(self.track, decoded):
+            self.assertLessEqual(abs(float(lat) - dlat), 0.5e-5 + 1e-12)
+            self.assertLessEqual(abs(float(lon) - dlon), 0.5e-5 + 1e-12)
+        truncated = BytesIO(stream.getvalue()[:-1])
+        self.assertRaises(InvalidArgument, list, decode_stream(truncated))
+        self.assertRaises(InvalidArgument, encode_stream, self.track, 6, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
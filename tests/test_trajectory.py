@@ -0,0 +1,54 @@
+import unittest  # NOQA
+from customexceptions import InvalidArgument  # NOQA
+from latitudecoordinates import Latitude  # NOQA
+from longitudecoordinates import Longitude  # NOQA
+from trajectory import TrajectorySimplifier, douglas_peucker, simplify_stream  # NOQA
+
+
+def track(points):
+    return [(Latitude.cast(lat), Longitude.cast(lon)) for lat, lon in points]
+
+
+class TrajectoryTest(unittest.TestCase):
+    def setUp(self):
+        # A straight run along the equator, a detour north, then straight again
+        self.straight = track([(0, i * 0.001) for i in range(11)])
+        self.detour = track([(0, 0), (0, 0.001), (0, 0.002), (0.01, 0.003),
+                             (0, 0.004), (0, 0.005)])
+
+    def test_douglas_peucker(self):
+        simplified, report = douglas_peucker(self.straight, tolerance=1)
+        self.assertEqual(simplified, [self.straight[0], self.straight[-1]])
+        self.assertEqual(report.points_in, 11)
+        self.assertEqual(report.points_out, 2)
+        self.assertAlmostEqual(report.compression_ratio, 5.5)
+        self.assertLess(report.max_error, 1)
+        # The detour is about 1.1 km off the track and must be kept
+        simplified, report = douglas_peucker(self.detour, tolerance=10)
+        self.assertIn(self.detour[3], simplified)
+        self.assertLessEqual(report.max_error, 10)
+        # Short tracks are returned as-is
+        simplified, report = douglas_peucker(self.straight[:2], tolerance=1)
+        self.assertEqual(simplified, self.straight[:2])
+        self.assertRaises(InvalidArgument, douglas_peucker, self.straight, -1)
+
+    def test_streaming(self):
+        self.assertEqual(list(simplify_stream(iter(self.straight), tolerance=1)),
+                         [self.straight[0], self.straight[-1]])
+        simplifier = TrajectorySimplifier(tolerance=10)
+        simplified = list(simplifier.simplify(iter(self.detour)))
+        self.assertEqual(simplified[0], self.detour[0])
+        self.assertEqual(simplified[-1], self.detour[-1])
+        self.assertIn(self.detour[3], simplified)
+        self.assertEqual(simplifier.report.points_in, len(self.detour))
+        self.assertEqual(simplifier.report.points_out, len(simplified))
+        self.assertLessEqual(simplifier.report.max_error, 10)
+        # A small window forces positions to be kept to bound memory
+        simplifier = TrajectorySimplifier(tolerance=1, window=3)
+        self.assertEqual(len(list(simplifier.simplify(self.straight))), 5)
+        self.assertRaises(InvalidArgument, TrajectorySimplifier, 1, 1)
+        self.assertRaises(InvalidArgument, TrajectorySimplifier, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()